@@ -8,6 +8,54 @@ It ensures:
 - Keys appear in the same order across records
 """
 
+import mmap
+import os
+import traceback
+
+import numpy as np
+from numba import njit
+
+BLANK_LINE = -1  # Sentinel key index for a missing blank separator
+
+
+@njit(cache=True)
+def _find_invalid_line(buf, starts, ends, prefixes, prefix_lens):
+    """
+    Scan every record for a missing blank line or an unexpected key.
+
+    Args:
+        buf (np.ndarray): Raw file bytes.
+        starts (np.ndarray): Start offset of each line.
+        ends (np.ndarray): End offset of each line, excluding line endings.
+        prefixes (np.ndarray): Expected "key:" prefixes, zero-padded.
+        prefix_lens (np.ndarray): Length of each expected prefix.
+
+    Returns:
+        tuple[int, int]: (record index, key index) of the first problem,
+        with BLANK_LINE as the key index for a missing blank line, or
+        (-1, 0) when every record is valid.
+    """
+    n_keys = prefixes.shape[0]
+    n_lines = starts.shape[0]
+
+    for r in range(n_lines // (n_keys + 1)):
+        first = r * (n_keys + 1)
+        blank = first + n_keys
+
+        if blank + 1 < n_lines and ends[blank] != starts[blank]:
+            return r, BLANK_LINE
+
+        for j in range(n_keys):
+            start = starts[first + j]
+            if ends[first + j] - start < prefix_lens[j]:
+                return r, j
+            for k in range(prefix_lens[j]):
+                if buf[start + k] != prefixes[j, k]:
+                    return r, j
+
+    return -1, 0
+
+
 def validate_wine_reviews(file_path: str) -> tuple[bool, str]:
     """
     Validates whether a wine review dataset has the expected format.
@@ -30,31 +78,91 @@ def validate_wine_reviews(file_path: str) -> tuple[bool, str]:
         "review/text"
     ]
 
-    with open(file_path, "r", encoding="latin-1") as f:
-        lines = [line.rstrip("\n") for line in f]
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True, "All records are valid and formatted correctly."
+
+        # Map the file instead of copying it into a bytes object
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return _validate_buffer(np.frombuffer(mm, dtype=np.uint8), expected_keys)
+            except BaseException as exc:
+                # Frames in the traceback still reference the mapped buffer,
+                # which would make closing the mapping raise BufferError
+                traceback.clear_frames(exc.__traceback__)
+                raise
+
+
+def _validate_buffer(buf: np.ndarray, expected_keys: list[str]) -> tuple[bool, str]:
+    """
+    Validates the raw bytes of a wine review dataset.
+
+    Args:
+        buf (np.ndarray): Raw file bytes.
+        expected_keys (list[str]): Keys expected on each record's lines, in order.
+
+    Returns:
+        tuple[bool, str]: (Validation success flag, validation message)
+    """
+    # Split lines like text mode does: at "\n", "\r\n" or a lone "\r".
+    # Carriage returns are normally absent, so they are handled as a short
+    # index list rather than with further full-size masks.
+    breaks = np.flatnonzero(buf == 0x0A)
+    crs = np.flatnonzero(buf == 0x0D)
+
+    crlf = np.zeros(len(crs), dtype=bool)
+    if len(breaks) and len(crs):
+        pos = np.minimum(np.searchsorted(breaks, crs + 1), len(breaks) - 1)
+        crlf = breaks[pos] == crs + 1
+    if not crlf.all():
+        breaks = np.sort(np.concatenate((breaks, crs[~crlf])))
+
+    starts = np.empty(len(breaks) + 1, dtype=np.int64)
+    starts[0] = 0
+    np.add(breaks, 1, out=starts[1:])
+    ends = np.empty(len(breaks) + 1, dtype=np.int64)
+    ends[:-1] = breaks
+    ends[-1] = len(buf)
+    del breaks
+
+    # CRLF lines end before the carriage return
+    ends[np.searchsorted(ends, crs[crlf] + 1)] -= 1
+
+    # A trailing line break does not open another line
+    if starts[-1] == len(buf):
+        starts, ends = starts[:-1], ends[:-1]
+
+    n_lines = len(starts)
 
     # Handle case where last record has no trailing blank
-    if (len(lines) + 1) % 10 == 0:
-        lines.append("")
+    if (n_lines + 1) % 10 == 0:
+        n_lines += 1
+        starts = np.append(starts, len(buf))
+        ends = np.append(ends, len(buf))
+
+    if n_lines % 10 != 0:
+        return False, f"File length ({n_lines}) is not aligned with 10-line blocks."
 
-    if len(lines) % 10 != 0:
-        return False, f"File length ({len(lines)}) is not aligned with 10-line blocks."
+    key_prefixes = [(key + ":").encode("latin-1") for key in expected_keys]
+    prefix_lens = np.array([len(prefix) for prefix in key_prefixes], dtype=np.int64)
+    prefixes = np.zeros((len(key_prefixes), prefix_lens.max()), dtype=np.uint8)
+    for j, prefix in enumerate(key_prefixes):
+        prefixes[j, :len(prefix)] = np.frombuffer(prefix, dtype=np.uint8)
 
-    for i in range(0, len(lines), 10):
-        record_lines = lines[i:i + 9]
-        blank_line = lines[i + 9]
+    record, key = _find_invalid_line(buf, starts, ends, prefixes, prefix_lens)
 
-        if i + 10 < len(lines) and blank_line != "":
-            return False, f"Missing blank line after record {i // 10 + 1}."
+    if record < 0:
+        return True, "All records are valid and formatted correctly."
 
-        for j, (expected_key, line) in enumerate(zip(expected_keys, record_lines)):
-            if not line.startswith(expected_key + ":"):
-                return False, (
-                    f"Record {i // 10 + 1}, line {j + 1} "
-                    f"expected key '{expected_key}' but found '{line.split(':',1)[0]}'"
-                )
+    if key == BLANK_LINE:
+        return False, f"Missing blank line after record {record + 1}."
 
-    return True, "All records are valid and formatted correctly."
+    line_no = record * 10 + key
+    line = buf[starts[line_no]:ends[line_no]].tobytes().decode("latin-1")
+    return False, (
+        f"Record {record + 1}, line {key + 1} "
+        f"expected key '{expected_keys[key]}' but found '{line.split(':', 1)[0]}'"
+    )
 
 
 if __name__ == "__main__":
@@ -10,7 +10,14 @@ import pandas as pd
 import numpy as np
 import logging
 import html
-from transformers import pipeline, AutoTokenizer
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import pyarrow as pa
+import pyarrow.compute as pc
+import torch
+import xxhash
+from transformers import pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
 
 # ---------------------------------------------------------------------
 # Logging Configuration
@@ -25,58 +32,205 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------
 # Data Loading and Cleaning
 # ---------------------------------------------------------------------
-def load_wine_data(file_path: str) -> pd.DataFrame:
+RAW_KEYS = [
+    "wine/name",
+    "wine/wineId",
+    "wine/variant",
+    "wine/year",
+    "review/points",
+    "review/time",
+    "review/userId",
+    "review/userName",
+    "review/text",
+]
+RECORD_LINES = len(RAW_KEYS) + 1  # Key lines plus the blank separator
+KEY_PREFIXES = [key + ":" for key in RAW_KEYS]
+READ_BLOCK_RECORDS = 100_000
+READ_BUFFER_BYTES = 1 << 20  # Large sequential reads instead of the 8 KiB default
+SAMPLE_SIZE = 50_000
+SAMPLE_SEED = 42
+COLUMN_NAMES = [
+    "wine_id" if key == "wine/wineId" else key.replace("/", "_") for key in RAW_KEYS
+]
+KEPT_COLUMNS = ["wine_name", "wine_variant", "wine_year", "review_points", "review_text"]
+DEDUP_KEYS = ["wine_id", "review_userId", "review_time"]
+NUMERIC_COLUMNS = ["wine_year", "review_points"]
+TEXT_COLUMNS = [column for column in KEPT_COLUMNS if column not in NUMERIC_COLUMNS]
+COMMON_ENTITIES = {"&amp;": "&", "&lt;": "<", "&gt;": ">", "&quot;": '"', "&#39;": "'"}
+COMMON_ENTITY_PATTERN = r"&(?:amp|lt|gt|quot|#39);"
+RARE_ENTITY_PATTERN = r"&(?!(?:amp|lt|gt|quot|#39);)"  # Any "&" not opening a common entity
+
+
+def _unescape_html(values: pd.Series) -> pd.Series:
     """
-    Load and process wine review data from a text file.
+    Unescape HTML entities, visiting only the values that contain one.
+
+    Values whose entities are all among the common five are handled by a
+    single regex pass; anything else falls back to ``html.unescape``.
 
     Args:
-        file_path (str): Path to the wine reviews text file.
+        values (pd.Series): String values.
 
     Returns:
-        pd.DataFrame: Cleaned DataFrame containing wine review data.
+        pd.Series: Values with HTML entities unescaped.
     """
-    logger.info(f"Loading data from {file_path}")
-    records, current_record = [], {}
+    has_entity = values.str.contains("&", regex=False)
+    if not has_entity.any():
+        return values
+
+    values = values.copy()
+    rare = has_entity & values.str.contains(RARE_ENTITY_PATTERN, regex=True)
+    common = has_entity & ~rare
+
+    values[common] = values[common].str.replace(
+        COMMON_ENTITY_PATTERN, lambda match: COMMON_ENTITIES[match.group(0)], regex=True
+    )
+    if rare.any():
+        values[rare] = values[rare].map(html.unescape)
+    return values
+
+
+def _read_record_blocks(file):
+    """
+    Yield lines from an open reviews file in blocks of whole records.
 
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as file:
-        for line in file:
-            line = line.strip()
+    Args:
+        file (TextIO): Open wine reviews text file.
 
-            if not line:  # Blank line = end of record
-                if current_record:
-                    records.append(current_record)
-                    current_record = {}
-                continue
+    Yields:
+        list[str]: Lines of up to READ_BLOCK_RECORDS complete records.
+    """
+    block_lines = READ_BLOCK_RECORDS * RECORD_LINES
+
+    for lines in iter(lambda: list(islice(file, block_lines)), []):
+        if len(lines) % RECORD_LINES != 0:
+            # Only the final block can be short: drop trailing blanks,
+            # then restore the final record's separator
+            while lines and not lines[-1].strip():
+                lines.pop()
+            if not lines:
+                return
+            lines.append("")
+
+            if len(lines) % RECORD_LINES != 0:
+                raise ValueError(
+                    f"Final block ({len(lines)} lines) is not aligned with "
+                    f"{RECORD_LINES}-line records; run data/validator.py to "
+                    f"locate the malformed record."
+                )
+        yield lines
+
+
+def _parse_record_block(lines: list[str]) -> pd.DataFrame:
+    """
+    Parse a block of complete records into one row per record.
 
-            if ":" in line:
-                key, value = line.split(":", 1)
-                current_record[key.strip()] = html.unescape(value.strip())
+    Args:
+        lines (list[str]): Lines of complete records.
 
-    if current_record:  # Catch last record
-        records.append(current_record)
+    Returns:
+        pd.DataFrame: Raw string values, one column per key.
+    """
+    # Convert the block to Arrow once; record fields sit at fixed positions
+    block = pa.array(lines, type=pa.string())
 
-    logger.info(f"Total records collected: {len(records):,}")
+    columns = {}
+    for j, (prefix, column) in enumerate(zip(KEY_PREFIXES, COLUMN_NAMES)):
+        key_lines = pc.take(block, np.arange(j, len(lines), RECORD_LINES))
 
-    df = pd.DataFrame(records)
-    df.columns = df.columns.str.replace("/", "_")
-    df = df.rename(columns={"wine_wineId": "wine_id"})
+        if not pc.all(pc.starts_with(key_lines, prefix)).as_py():
+            raise ValueError(
+                f"Expected key '{prefix[:-1]}' on line {j + 1} of every record; "
+                f"run data/validator.py to locate the malformed record."
+            )
 
-    if "review_time" in df.columns:
-        df["review_time"] = pd.to_datetime(df["review_time"].astype(int), unit="s")
-        logger.info(f"Converted review_time to datetime. "
-                    f"Range: {df['review_time'].min()} → {df['review_time'].max()}")
+        # Strip the "key:" prefix and surrounding whitespace in Arrow kernels
+        columns[column] = pc.utf8_trim_whitespace(pc.utf8_slice_codeunits(key_lines, len(prefix)))
 
-    # Remove duplicates and unnecessary columns
-    df = df.drop_duplicates(subset=["wine_id", "review_userId", "review_time"], keep="first")
-    df = df.drop(columns=["review_time", "review_userId", "review_userName", "wine_id"], errors="ignore")
+    table = pa.table(columns)
+    return table.to_pandas(self_destruct=True)
 
-    # Clean missing values
-    df.replace("N/A", np.nan, inplace=True)
-    df = df.dropna()
 
-    # Sample down to 50,000 records
-    if len(df) > 50000:
-        df = df.sample(n=50000, random_state=42)
+def load_wine_data(file_path: str) -> pd.DataFrame:
+    """
+    Load and process wine review data from a text file.
+
+    The file is expected in the layout checked by ``data/validator.py``:
+    nine "key: value" lines per record followed by a blank line. Records
+    are deduplicated and filtered while streaming, and a reservoir sample
+    of SAMPLE_SIZE records is kept so only the sample is materialized.
+
+    Args:
+        file_path (str): Path to the wine reviews text file.
+
+    Returns:
+        pd.DataFrame: Cleaned DataFrame containing wine review data.
+    """
+    logger.info(f"Loading data from {file_path}")
+
+    rng = np.random.default_rng(SAMPLE_SEED)
+    reservoir = {column: np.empty(SAMPLE_SIZE, dtype=object) for column in KEPT_COLUMNS}
+    seen = np.empty(0, dtype=np.uint64)  # Sorted hashes of dedup keys read so far
+    n_records, n_valid = 0, 0
+    time_min, time_max = None, None
+
+    with open(file_path, "r", encoding="utf-8", errors="ignore",
+              buffering=READ_BUFFER_BYTES) as file:
+        for lines in _read_record_blocks(file):
+            block = _parse_record_block(lines)
+            n_records += len(block)
+
+            # Non-numeric values, including "N/A", become missing
+            for column in NUMERIC_COLUMNS:
+                block[column] = pd.to_numeric(block[column], errors="coerce")
+            block["review_time"] = block["review_time"].astype(np.int64)
+
+            block_min, block_max = block["review_time"].min(), block["review_time"].max()
+            time_min = block_min if time_min is None else min(time_min, block_min)
+            time_max = block_max if time_max is None else max(time_max, block_max)
+
+            # Keep the first occurrence of each review, even if invalid.
+            # Keys are compared by a deterministic 64-bit hash of all three fields.
+            hashes = pd.util.hash_pandas_object(block[DEDUP_KEYS], index=False).to_numpy()
+            is_new = ~pd.Series(hashes).duplicated().to_numpy()
+            if len(seen):
+                pos = np.minimum(np.searchsorted(seen, hashes), len(seen) - 1)
+                is_new &= seen[pos] != hashes
+            new_hashes = np.sort(hashes[is_new])
+            seen = np.insert(seen, np.searchsorted(seen, new_hashes), new_hashes)
+
+            valid = (
+                block[NUMERIC_COLUMNS].notna().all(axis=1)
+                & (block[TEXT_COLUMNS] != "N/A").all(axis=1)
+            ).to_numpy()
+            rows = np.flatnonzero(is_new & valid)
+
+            # Reservoir sampling (Algorithm R): the i-th valid record fills slot i
+            # until the reservoir is full, then replaces a random slot in [0, i]
+            order = n_valid + np.arange(len(rows))
+            slots = np.where(order < SAMPLE_SIZE, order, rng.integers(0, order + 1))
+            n_valid += len(rows)
+
+            kept = slots < SAMPLE_SIZE
+            rows, slots = rows[kept][::-1], slots[kept][::-1]
+            _, last = np.unique(slots, return_index=True)  # Later records win a shared slot
+            rows, slots = rows[last], slots[last]
+
+            # Only records entering the reservoir are materialized
+            for column in KEPT_COLUMNS:
+                reservoir[column][slots] = block[column].iloc[rows].to_numpy()
+
+    logger.info(f"Total records collected: {n_records:,}")
+    if time_min is not None:
+        logger.info(f"Review time range: {pd.to_datetime(time_min, unit='s')} → "
+                    f"{pd.to_datetime(time_max, unit='s')}")
+    logger.info(f"Unique valid records: {n_valid:,}")
+
+    n_kept = min(n_valid, SAMPLE_SIZE)
+    df = pd.DataFrame({column: values[:n_kept] for column, values in reservoir.items()})
+    df = df.astype({column: np.int16 for column in NUMERIC_COLUMNS})
+    for column in TEXT_COLUMNS:
+        df[column] = _unescape_html(df[column])
 
     logger.info(f"Final DataFrame shape: {df.shape}")
     return df
@@ -85,121 +239,271 @@ def load_wine_data(file_path: str) -> pd.DataFrame:
 # ---------------------------------------------------------------------
 # Rating Band Assignment
 # ---------------------------------------------------------------------
-def assign_rating_band(points: int) -> str:
+RATING_BINS = np.array([60, 70, 80, 85, 90, 95], dtype=np.int16)
+RATING_LABELS = [
+    "50-59 (Very Poor)",
+    "60-69 (Poor)",
+    "70-79 (Average)",
+    "80-84 (Good)",
+    "85-89 (Very Good)",
+    "90-94 (Excellent)",
+    "95-100 (Perfect)",
+]
+RATING_BAND_DTYPE = pd.CategoricalDtype(categories=RATING_LABELS, ordered=True)
+
+
+def assign_rating_bands(points: pd.Series) -> pd.Categorical:
     """
-    Assign a rating band based on review points.
+    Assign a rating band to every review based on its points.
+
+    Each bin edge is the inclusive lower bound of the next band. Bands are
+    returned as an ordered categorical so grouping hashes one-byte codes.
 
     Args:
-        points (int): Review score.
+        points (pd.Series): Review scores.
 
     Returns:
-        str: Rating band description.
-    """
-    if points < 60:
-        return "50-59 (Very Poor)"
-    elif points < 70:
-        return "60-69 (Poor)"
-    elif points < 80:
-        return "70-79 (Average)"
-    elif points < 85:
-        return "80-84 (Good)"
-    elif points < 90:
-        return "85-89 (Very Good)"
-    elif points < 95:
-        return "90-94 (Excellent)"
-    return "95-100 (Perfect)"
+        pd.Categorical: Rating band descriptions.
+    """
+    codes = np.searchsorted(RATING_BINS, points.to_numpy(dtype=np.int16), side="right")
+    return pd.Categorical.from_codes(codes, dtype=RATING_BAND_DTYPE)
 
 
 # ---------------------------------------------------------------------
 # Summarization Utilities
 # ---------------------------------------------------------------------
 MODEL_NAME = "facebook/bart-large-cnn"
-summarizer = pipeline("summarization", model=MODEL_NAME)
+MODEL_MAX_TOKENS = 1024
+BATCH_SIZE = 16
+SUMMARY_INTRO = "Summarize the following reviews for a group of wines.\n"
+
+# Half precision halves weight bandwidth during generation: fp16 on GPU,
+# bf16 on CPU where fp16 matmuls are poorly supported.
+if torch.cuda.is_available():
+    DEVICES, DTYPE = list(range(torch.cuda.device_count())), torch.float16
+else:
+    DEVICES, DTYPE = [-1], torch.bfloat16
+
+# Compilation only pays back its warm-up on GPU; inputs vary in length.
+# Multi-GPU pipelines run in worker threads, where Dynamo compilation is
+# not thread-safe, so only a single GPU is compiled.
+COMPILE_MODEL = torch.cuda.is_available() and len(DEVICES) == 1
+
 tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
 
 
-def chunk_text(texts, max_tokens: int = 900) -> list[str]:
+def _build_summarizer(device: int):
     """
-    Split long text into manageable chunks for the summarizer.
+    Load a summarization pipeline on a single device.
+
+    The model uses PyTorch's fused SDPA attention kernels and, on a single
+    GPU, is compiled. Each pipeline gets its own tokenizer, since fast
+    tokenizers cannot be shared between threads.
 
     Args:
-        texts (list[str]): List of review texts.
-        max_tokens (int): Maximum tokens per chunk.
+        device (int): CUDA device index, or -1 for CPU.
 
     Returns:
-        list[str]: Chunked review text.
+        SummarizationPipeline: Pipeline bound to the device.
     """
-    combined = " ".join(texts)
-    tokens = tokenizer.encode(combined, truncation=False)
+    model = AutoModelForSeq2SeqLM.from_pretrained(
+        MODEL_NAME, torch_dtype=DTYPE, attn_implementation="sdpa"
+    )
+    if COMPILE_MODEL:
+        model.forward = torch.compile(model.forward, dynamic=True)
+    return pipeline(
+        "summarization",
+        model=model,
+        tokenizer=AutoTokenizer.from_pretrained(MODEL_NAME),
+        device=device,
+    )
+
+
+summarizers = [_build_summarizer(device) for device in DEVICES]
 
-    chunks = []
-    for i in range(0, len(tokens), max_tokens):
-        chunk_tokens = tokens[i:i + max_tokens]
-        chunk_text = tokenizer.decode(chunk_tokens, skip_special_tokens=True)
-        chunks.append(chunk_text)
-    return chunks
+# Generated summaries keyed by (chunk hash, max length, min length)
+summary_cache: dict[tuple[int, int, int], str] = {}
 
 
-def summarize_group(row, max_len: int = 80, min_len: int = 30) -> str:
+def chunk_texts(text_groups, max_tokens: int = 900,
+                single_pass_tokens: int = 900) -> list[list[tuple[str, int]]]:
     """
-    Generate a summary for a group of reviews.
+    Split each group's combined text into manageable chunks for the summarizer.
+
+    All groups are tokenized in a single batched call. Texts no longer than
+    ``single_pass_tokens`` are kept whole, even if they exceed ``max_tokens``.
 
     Args:
-        row (pd.Series): Row containing grouped reviews and metadata.
-        max_len (int): Maximum summary length.
+        text_groups (Iterable[list[str]]): Review texts for each group.
+        max_tokens (int): Maximum tokens per chunk.
+        single_pass_tokens (int): Maximum tokens for a text to stay in one chunk.
+
+    Returns:
+        list[list[tuple[str, int]]]: Chunked text with each chunk's token count, per group.
+    """
+    combined = [" ".join(texts) for texts in text_groups]
+    if not combined:
+        return []
+
+    encodings = tokenizer(
+        combined, add_special_tokens=False, return_offsets_mapping=True
+    )["offset_mapping"]
+
+    # Slice the original strings at token boundaries instead of decoding
+    chunk_groups = []
+    for text, offsets in zip(combined, encodings):
+        step = max(len(offsets), 1) if len(offsets) <= single_pass_tokens else max_tokens
+        chunks = []
+        for i in range(0, len(offsets), step):
+            end = min(i + step, len(offsets))
+            chunks.append((text[offsets[i][0]:offsets[end - 1][1]], end - i))
+        chunk_groups.append(chunks)
+    return chunk_groups
+
+
+def _stream_summaries(summarizer, texts: list[str], max_length: int, min_len: int,
+                      batch_size: int) -> list[str]:
+    """
+    Stream texts through one pipeline so preprocessing overlaps generation.
+
+    Args:
+        summarizer (SummarizationPipeline): Pipeline to run.
+        texts (list[str]): Chunk texts, without the intro prompt.
+        max_length (int): Maximum summary length.
         min_len (int): Minimum summary length.
+        batch_size (int): Number of chunks per forward pass.
 
     Returns:
-        str: Generated summary.
+        list[str]: One summary per text, in input order.
     """
-    reviews = row["review_texts"]
-    intro = (
-        f"Summarize the following reviews for a group of wines.\n"
+    if not texts:
+        return []
+
+    outputs = summarizer(
+        (SUMMARY_INTRO + text for text in texts),
+        batch_size=batch_size,
+        max_length=max_length,
+        min_length=min_len,
+        do_sample=False,
+        truncation=True,
     )
+    return [output[0]["summary_text"] for output in outputs]
 
-    chunks = chunk_text(reviews)
-    summaries = []
 
-    for chunk in chunks:
-        input_len = len(tokenizer.encode(chunk, add_special_tokens=False))
-        dynamic_max = min(max_len, max(min_len + 5, int(input_len * 0.8)))
+def _summarize_chunks(chunks: list[tuple[str, int]], max_len: int, min_len: int,
+                      batch_size: int = BATCH_SIZE) -> list[str]:
+    """
+    Summarize a flat list of chunks with batched pipeline calls.
 
-        result = summarizer(
-            intro + chunk,
-            max_length=dynamic_max,
-            min_length=min_len,
-            do_sample=False,
-            truncation=True,
-        )
-        summaries.append(result[0]["summary_text"])
-
-    if len(summaries) > 1:  # Re-summarize combined chunks if necessary
-        combined = " ".join(summaries)
-        combined_chunks = chunk_text([combined])
-        final_summaries = []
-
-        for chunk in combined_chunks:
-            input_len = len(tokenizer.encode(chunk, add_special_tokens=False))
-            dynamic_max = min(max_len, max(min_len + 5, int(input_len * 0.8)))
-
-            result = summarizer(
-                intro + chunk,
-                max_length=dynamic_max,
-                min_length=min_len,
-                do_sample=False,
-                truncation=True,
+    Identical chunks are generated once and memoized in ``summary_cache``.
+    The rest are bucketed by their dynamic max length, since generation
+    arguments apply to a whole pipeline call. Each bucket is sharded
+    across the available devices, one pipeline per device.
+
+    Args:
+        chunks (list[tuple[str, int]]): Chunked review text with token counts.
+        max_len (int): Maximum summary length.
+        min_len (int): Minimum summary length.
+        batch_size (int): Number of chunks per forward pass.
+
+    Returns:
+        list[str]: One summary per chunk, in input order.
+    """
+    summaries = [""] * len(chunks)
+    pending = defaultdict(list)  # Cache key -> indices of chunks awaiting it
+    buckets = defaultdict(list)  # Dynamic max length -> cache keys to generate
+    for idx, (text, input_len) in enumerate(chunks):
+        dynamic_max = min(max_len, max(min_len + 5, int(input_len * 0.8)))
+        key = (xxhash.xxh3_64_intdigest(text.encode("utf-8")), dynamic_max, min_len)
+
+        if key in summary_cache:
+            summaries[idx] = summary_cache[key]
+            continue
+        if key not in pending:
+            buckets[dynamic_max].append(key)
+        pending[key].append(idx)
+
+    logger.info(f"Summarizing {len(pending):,} of {len(chunks):,} chunks "
+                f"({len(chunks) - len(pending):,} cached or repeated)")
+
+    with ThreadPoolExecutor(max_workers=len(summarizers)) as executor:
+        for dynamic_max, keys in buckets.items():
+            shards = [keys[i::len(summarizers)] for i in range(len(summarizers))]
+            results = executor.map(
+                lambda summarizer, shard: _stream_summaries(
+                    summarizer, [chunks[pending[key][0]][0] for key in shard],
+                    dynamic_max, min_len, batch_size
+                ),
+                summarizers,
+                shards,
             )
-            final_summaries.append(result[0]["summary_text"])
+            for shard, shard_summaries in zip(shards, results):
+                for key, summary in zip(shard, shard_summaries):
+                    summary_cache[key] = summary
+                    for idx in pending[key]:
+                        summaries[idx] = summary
+    return summaries
+
 
-        summary_text = " ".join(final_summaries)
-    else:
-        summary_text = summaries[0]
+def _summarize_chunk_groups(chunk_groups: list[list[tuple[str, int]]], max_len: int,
+                            min_len: int, batch_size: int) -> list[list[str]]:
+    """
+    Summarize every chunk of every group in one flat batched run.
+
+    Args:
+        chunk_groups (list[list[tuple[str, int]]]): Chunks per group.
+        max_len (int): Maximum summary length.
+        min_len (int): Minimum summary length.
+        batch_size (int): Number of chunks per forward pass.
+
+    Returns:
+        list[list[str]]: Chunk summaries per group.
+    """
+    flat_chunks = [chunk for chunks in chunk_groups for chunk in chunks]
+    summaries = iter(_summarize_chunks(flat_chunks, max_len, min_len, batch_size))
+    return [[next(summaries) for _ in chunks] for chunks in chunk_groups]
+
+
+def summarize_groups(groups: pd.DataFrame, max_len: int = 80, min_len: int = 30,
+                     batch_size: int = BATCH_SIZE) -> list[str]:
+    """
+    Generate a summary for every group of reviews.
+
+    Chunks from all groups are summarized together, then groups with more
+    than one chunk are re-summarized in a second batched pass.
+
+    Args:
+        groups (pd.DataFrame): Grouped reviews with a ``review_texts`` column.
+        max_len (int): Maximum summary length.
+        min_len (int): Minimum summary length.
+        batch_size (int): Number of chunks per forward pass.
+
+    Returns:
+        list[str]: Generated summaries, one per group.
+    """
+    # Inputs that fit the model context alongside the summary need only one pass
+    single_pass_tokens = MODEL_MAX_TOKENS - max_len
+
+    group_summaries = _summarize_chunk_groups(
+        chunk_texts(groups["review_texts"], single_pass_tokens=single_pass_tokens),
+        max_len, min_len, batch_size,
+    )
+    results = [summaries[0] for summaries in group_summaries]
+
+    # Re-summarize combined chunks if necessary
+    multi_chunk = [idx for idx, summaries in enumerate(group_summaries) if len(summaries) > 1]
+    final_summaries = _summarize_chunk_groups(
+        chunk_texts([group_summaries[idx] for idx in multi_chunk], single_pass_tokens=single_pass_tokens),
+        max_len, min_len, batch_size,
+    )
+    for idx, summaries in zip(multi_chunk, final_summaries):
+        results[idx] = " ".join(summaries)
 
     logger.info(
-        f"Successfully generated summary"
+        f"Successfully generated {len(results)} summaries"
     )
 
-    return summary_text
+    return results
 
 
 # ---------------------------------------------------------------------
@@ -211,28 +515,29 @@ def main():
 
     try:
         df = load_wine_data(file_path)
+        # Persisted for inspection only; the in-memory frame keeps its dtypes
         df.to_csv("data/cleaned_wine_reviews.csv", index=False)
     except Exception as e:
         logger.error(f"Failed to load data: {e}")
         raise
 
-    # Reload cleaned data
-    df = pd.read_csv("data/cleaned_wine_reviews.csv")
-
     # Assign rating bands
-    df["rating_band"] = df["review_points"].apply(assign_rating_band)
+    df["rating_band"] = assign_rating_bands(df["review_points"])
 
-    # Group reviews
+    # Group reviews; categorical keys hash integer codes instead of strings
+    df["wine_variant"] = df["wine_variant"].astype("category")
     grouped = (
-        df.groupby(["wine_variant", "rating_band"])
+        df.groupby(["wine_variant", "rating_band"], observed=True)
         .agg(
             review_texts=("review_text", list),
             avg_points=("review_points", "mean"),
-            wine_years=("wine_year", lambda x: list(set(x))),
+            wine_years=("wine_year", "unique"),
             review_count=("review_text", "size"),
         )
         .reset_index()
     )
+    grouped["wine_years"] = grouped["wine_years"].map(np.ndarray.tolist)
+    grouped["avg_points"] = grouped["avg_points"].astype(np.float32)
 
     # Filter groups with at least 5 reviews
     filtered = grouped[grouped["review_count"] >= 5]
@@ -240,7 +545,7 @@ def main():
     # Generate sample summaries
     logger.info("Generating summaries for sample groups...")
     sample_groups = filtered.sample(n=5, random_state=42).copy()
-    sample_groups["summary"] = sample_groups.apply(summarize_group, axis=1)
+    sample_groups["summary"] = summarize_groups(sample_groups)
 
     # Save results
     sample_groups.to_csv("data/wine_group_summaries.csv", index=False)